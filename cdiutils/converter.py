@@ -4,7 +4,7 @@ import numpy as np
 from scipy.interpolate import RegularGridInterpolator
 import xrayutilities as xu
 
-from cdiutils.utils import center, crop_at_center
+from cdiutils.utils import center, get_centering_indices
 from cdiutils.geometry import Geometry
 
 
@@ -276,14 +276,18 @@ class SpaceConverter():
         if self._cropped_shape == self._full_shape:
             return self._q_space_transitions.copy()
 
+        # the three transitions share the same centering and cropping,
+        # gather only the cropped region instead of rolling full volumes
+        indices = get_centering_indices(
+            self._full_shape,
+            self._reference_voxel,
+            final_shape=self._cropped_shape
+        )
         q_space_transitions = np.empty((3,) + self._cropped_shape)
         for i in range(3):
-            q_space_transitions[i] = crop_at_center(
-                center(
-                    self._q_space_transitions[i],
-                    where=self._reference_voxel
-                ),
-                final_shape=self._cropped_shape
+            q_space_transitions[i] = center(
+                self._q_space_transitions[i],
+                precomputed_indices=indices
             )
         return q_space_transitions
 
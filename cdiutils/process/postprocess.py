@@ -49,8 +49,9 @@ class PostProcessor:
             and the associated support.
         """
 
+        # make_support already normalizes the amplitude
         support = make_support(
-            normalize(np.abs(complex_object)),
+            np.abs(complex_object),
             isosurface=isosurface,
             nan_values=False
         )
@@ -1085,7 +1085,8 @@ class BcdiProcessor:
                 self.structural_properties["amplitude"]
                 * np.exp(-1j*self.structural_properties["phase"])
             ),
-            output_shape=shape
+            output_shape=shape,
+            dtype=np.complex64
         )
         final_object_fft = np.abs(np.fft.ifftshift(
             np.fft.fftn(
@@ -1,12 +1,13 @@
 import inspect
+import math
 from typing import Optional
 import warnings
 
 import numpy as np
 import matplotlib
-import seaborn as sns
-from scipy.ndimage import convolve, center_of_mass
-from scipy.stats import gaussian_kde
+import matplotlib.pyplot
+from scipy.ndimage import convolve1d, center_of_mass
+from scipy.signal import fftconvolve
 import textwrap
 import xrayutilities as xu
 
@@ -16,24 +17,70 @@ from cdiutils.plot.formatting import get_figure_size
 def pretty_print(text: str, max_char_per_line: int = 79) -> None:
     """Print text with a frame of stars."""
 
+    frame = "*" * (max_char_per_line+4)
     pretty_text = "\n".join(
         [
             "",
-            "*" * (max_char_per_line+4),
+            frame,
             *[
                 f"* {w[::-1].center(max_char_per_line)[::-1]} *"
                 for w in textwrap.wrap(text, width=max_char_per_line)
             ],
-            "*" * (max_char_per_line+4),
+            frame,
             "",
         ]
     )
     print(pretty_text)
 
 
+# Above this kernel size, box sums of integer volumes are computed with
+# running (prefix) sums whose cost does not depend on the kernel size.
+PREFIX_SUM_MIN_KERNEL_SIZE = 9
+
+
+def _prefix_box_sum(volume: np.ndarray, kernel_size: int) -> np.ndarray:
+    """
+    Box sum computed, along each axis, as the difference of two shifted
+    cumulative sums. Only exact for integer data.
+    """
+    before = (kernel_size - 1) // 2
+    summed = volume
+    for axis in range(volume.ndim):
+        pad_width = [(0, 0)] * volume.ndim
+        pad_width[axis] = (before + 1, kernel_size - 1 - before)
+        cumulated = np.pad(summed, pad_width).cumsum(axis=axis)
+
+        upper = [slice(None)] * volume.ndim
+        lower = [slice(None)] * volume.ndim
+        upper[axis] = slice(kernel_size, kernel_size + volume.shape[axis])
+        lower[axis] = slice(0, volume.shape[axis])
+        summed = cumulated[tuple(upper)] - cumulated[tuple(lower)]
+    return summed.astype(volume.dtype, copy=False)
+
+
+def _box_sum(volume: np.ndarray, kernel_size: int) -> np.ndarray:
+    """
+    Sum the values of volume over a box of kernel_size along every
+    axis. Equivalent to a convolution with np.ones, but the box kernel
+    is separable so it is applied as successive 1D convolutions.
+    """
+    if (
+            kernel_size >= PREFIX_SUM_MIN_KERNEL_SIZE
+            and np.issubdtype(volume.dtype, np.integer)
+    ):
+        return _prefix_box_sum(volume, kernel_size)
+
+    kernel = np.ones(kernel_size)
+    summed = volume
+    for axis in range(volume.ndim):
+        summed = convolve1d(
+            summed, kernel, axis=axis, mode="constant", cval=0.0
+        )
+    return summed
+
+
 def size_up_support(support: np.ndarray) -> np.ndarray:
-    kernel = np.ones(shape=(3, 3, 3))
-    convolved_support = convolve(support, kernel, mode='constant', cval=0.0)
+    convolved_support = _box_sum(support, 3)
     return np.where(convolved_support > 3, 1, 0)
 
 
@@ -58,8 +105,7 @@ def find_hull(
     threshold (np.array).
     """
 
-    kernel = np.ones(shape=tuple(np.repeat(kernel_size, volume.ndim)))
-    convolved_support = convolve(volume, kernel, mode='constant', cval=0.0)
+    convolved_support = _box_sum(volume, kernel_size)
     hull = np.where(
         ((0 < convolved_support) & (convolved_support <= threshold)),
         1 if boolean_values else convolved_support,
@@ -89,27 +135,39 @@ def angle(v1: np.ndarray, v2: np.ndarray) -> float:
     return np.arccos(np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2)))
 
 
-def v1_to_v2_rotation_matrix(
+def _angle_and_axis(
         v1: np.ndarray,
         v2: np.ndarray
-) -> np.ndarray:
-    """ 
-    Rotation matrix around axis v1xv2
+) -> tuple[np.ndarray, float, float]:
     """
-    vec_rot_axis = np.cross(v1, v2)
-    normed_vrot = unit_vector(vec_rot_axis)
+    Return the unit rotation axis v1xv2 and the sine and cosine of the
+    angle between v1 and v2, computing each norm only once.
+    """
+    rot_axis = np.cross(v1, v2)
+    norm_product = np.sqrt(np.dot(v1, v1) * np.dot(v2, v2))
+    rot_axis_norm = np.sqrt(np.dot(rot_axis, rot_axis))
 
-    theta = angle(v1, v2)
+    # sin and cos are taken from the cross and dot products rather than
+    # from arccos, which is not accurate for nearly collinear vectors.
+    return (
+        rot_axis / rot_axis_norm,
+        rot_axis_norm / norm_product,
+        np.dot(v1, v2) / norm_product
+    )
 
-    n1, n2, n3 = normed_vrot
-    ct = np.cos(theta)
-    st = np.sin(theta)
 
-    r = np.array(((ct+n1**2*(1-ct), n1*n2*(1-ct)-n3*st, n1*n3*(1-ct)+n2*st),
-                  (n1*n2*(1-ct)+n3*st, ct+n2**2*(1-ct), n2*n3*(1-ct)-n1*st),
-                  (n1*n3*(1-ct)-n2*st, n2*n3*(1-ct)+n1*st, ct+n3**2*(1-ct))
-                  ))
-    return r
+def v1_to_v2_rotation_matrix(
+        v1: np.ndarray,
+        v2: np.ndarray
+) -> np.ndarray:
+    """
+    Rotation matrix around axis v1xv2, computed with Rodrigues' formula:
+    R = I + sin(theta) K + (1 - cos(theta)) K^2, K being the cross
+    product matrix of the unit rotation axis.
+    """
+    (n1, n2, n3), st, ct = _angle_and_axis(v1, v2)
+    k = np.array(((0, -n3, n2), (n3, 0, -n1), (-n2, n1, 0)))
+    return np.identity(3) + st * k + (1 - ct) * (k @ k)
 
 
 def normalize(
@@ -117,14 +175,11 @@ def normalize(
         zero_centered: bool = False
 ) -> np.ndarray:
     """Normalize a np.ndarray so the values are between 0 and 1."""
+    vmin, vmax = np.min(data), np.max(data)
     if zero_centered:
-        abs_max = np.max([np.abs(np.min(data)), np.abs(np.max(data))])
+        abs_max = max(abs(vmin), abs(vmax))
         vmin, vmax = -abs_max, abs_max
-        ptp = vmax - vmin
-    else:
-        ptp = np.ptp(data)
-        vmin = np.min(data)
-    return (data - vmin) / ptp
+    return (data - vmin) / (vmax - vmin)
 
 
 def basic_filter(data, maplog_min_value=3.5):
@@ -166,23 +221,51 @@ def shape_for_safe_centered_cropping(
 
 
 def _center_at_com(data: np.ndarray):
-    shape = data.shape
-    com = tuple(e for e in center_of_mass(data))
-    print((np.array(shape)/2 == np.array(com)).all())
-    com_to_center = np.array([
-        int(np.rint(shape[i]/2 - com[i]))
-        for i in range(3)
-    ])
-    if (com_to_center == np.array((0, 0, 0)).astype(int)).all():
-        return data, com
-    data = center(data, where=com)
-    return _center_at_com(data)
+    shape = np.array(data.shape)
+    while True:
+        com = tuple(e for e in center_of_mass(data))
+        com_to_center = np.rint(shape / 2 - np.array(com)).astype(int)
+        if not com_to_center.any():
+            return data, com
+        data = np.roll(data, shift=tuple(com_to_center), axis=(0, 1, 2))
+
+
+def get_centering_indices(
+        shape: tuple | list | np.ndarray,
+        reference_position: tuple | list | np.ndarray,
+        final_shape: tuple | list | np.ndarray = None
+) -> tuple[np.ndarray, ...]:
+    """
+    Compute, for each axis, the indices that gather data of the given
+    shape so reference_position is placed at the center, as center()
+    does. These can be computed once and passed to center() through
+    precomputed_indices for several arrays of the same shape.
+    :param shape: the shape of the data to center (tuple).
+    :param reference_position: the position to place at the center
+    (tuple).
+    :param final_shape: if provided, only the indices of the centered
+    region that crop_at_center would keep are returned, so centering
+    and cropping are done in a single pass (tuple).
+    :returns: a tuple of 1D index arrays, one per axis.
+    """
+    shape = np.array(shape)
+    shifts = np.rint(shape / 2 - np.array(reference_position)).astype(int)
+    if final_shape is None:
+        final_shape = shape
+    final_shape = np.array(final_shape)
+    starts = shape // 2 - final_shape // 2
+
+    return tuple(
+        (np.arange(start, start + f) - shift) % n
+        for n, f, start, shift in zip(shape, final_shape, starts, shifts)
+    )
 
 
 def center(
         data: np.ndarray,
         where: str | tuple | list | np.ndarray = "com",
-        return_former_center: bool = False
+        return_former_center: bool = False,
+        precomputed_indices: tuple[np.ndarray, ...] = None
 ) -> np.ndarray | tuple[np.ndarray, tuple]:
     """
     Center 3D volume data such that the center of mass or max  of data
@@ -194,8 +277,19 @@ def center(
     :param where: what region to place at the center (str), either
     com or max, or a tuple of the coordinates where to place the center
     at.
+    :param precomputed_indices: the indices returned by
+    get_centering_indices (tuple). If provided, where is ignored and
+    data are gathered using these indices.
     :returns: centered 3D numpy array.
     """
+    if precomputed_indices is not None:
+        if return_former_center:
+            raise ValueError(
+                "return_former_center cannot be used with "
+                "precomputed_indices."
+            )
+        return data[np.ix_(*precomputed_indices)]
+
     shape = data.shape
 
     if isinstance(where, (tuple, list, np.ndarray)) and len(where) == 3:
@@ -211,17 +305,12 @@ def center(
         )
     xcenter, ycenter, zcenter = reference_position
 
-    centered_data = np.roll(data, int(np.rint(shape[0] / 2 - xcenter)), axis=0)
-    centered_data = np.roll(
-        centered_data,
-        int(np.rint(shape[1] / 2 - ycenter)),
-        axis=1
-    )
-    centered_data = np.roll(
-        centered_data,
-        int(np.rint(shape[2] / 2 - zcenter)),
-        axis=2
+    # roll all the axes at once, i.e. a single copy of the data
+    shifts = tuple(
+        int(np.rint(shape[i] / 2 - reference_position[i]))
+        for i in range(3)
     )
+    centered_data = np.roll(data, shift=shifts, axis=(0, 1, 2))
 
     if return_former_center:
         return centered_data, (xcenter, ycenter, zcenter)
@@ -232,15 +321,22 @@ def center(
 def symmetric_pad(
         data: np.ndarray,
         output_shape: tuple | list | np.ndarray,
-        values: float = 0
+        values: float = 0,
+        dtype: np.dtype = None
 ) -> np.ndarray:
-    """Return padded data so it matches the provided final_shape"""
+    """
+    Return padded data so it matches the provided final_shape. If dtype
+    is provided, data are cast before padding, e.g. np.float32 halves
+    the memory footprint of the padded array.
+    """
 
     if data.ndim != len(output_shape):
         raise ValueError(
             f"output_shape length ({len(output_shape)}) should match of input "
             f"data dimension ({data.ndim})."
         )
+    if dtype is not None:
+        data = data.astype(dtype, copy=False)
     widths = []
     for current_s, output_s in zip(data.shape, output_shape):
         widths.append((output_s - current_s) // 2)
@@ -259,7 +355,8 @@ def symmetric_pad(
 
 def crop_at_center(
         data: np.ndarray,
-        final_shape: list | tuple | np.ndarray
+        final_shape: list | tuple | np.ndarray,
+        dtype: np.dtype = None
 ) -> np.ndarray:
     """
     Crop 3D array data to match the final_shape. Center of the input
@@ -267,6 +364,8 @@ def crop_at_center(
     :param data: 3D array data to be cropped (np.array).
     :param final_shape: the targetted shape (list). If None, nothing
     happens.
+    :param dtype: the dtype to cast the cropped data to (np.dtype). If
+    None, the dtype of data is kept.
     :returns: cropped 3D array (np.array).
     """
     shape = data.shape
@@ -278,6 +377,8 @@ def crop_at_center(
             f"the initial axis (initial shape: {shape}, final shape: "
             f"{tuple(final_shape)}).\nDid not proceed to cropping."
         )
+        if dtype is not None:
+            return data.astype(dtype, copy=False)
         return data
 
     c = np.array(shape) // 2  # coordinates of the center
@@ -291,7 +392,8 @@ def crop_at_center(
         c[1] - to_crop[1]: c[1] + to_crop[1] + plus_one[1],
         c[2] - to_crop[2]: c[2] + to_crop[2] + plus_one[2]
     ]
-
+    if dtype is not None:
+        return cropped.astype(dtype, copy=False)
     return cropped
 
 
@@ -310,34 +412,94 @@ def compute_distance_from_com(
     if com is None:
         com = center_of_mass(data)
 
-    for x, y, z in zip(nonzero_coordinates[0],
-                       nonzero_coordinates[1],
-                       nonzero_coordinates[2]):
-        distance = np.sqrt((x-com[0])**2 + (y-com[1])**2 + (z-com[2])**2)
-        distance_matrix[x, y, z] = distance
+    squared_distance = np.zeros(len(nonzero_coordinates[0]))
+    for coordinates, c in zip(nonzero_coordinates, com):
+        squared_distance += (coordinates - c) ** 2
+    distance_matrix[nonzero_coordinates] = np.sqrt(squared_distance)
 
     return distance_matrix
 
 
+class DistanceFromComCalculator:
+    """
+    Callable equivalent of compute_distance_from_com for repeated calls
+    on data of the same shape. The index grid is computed once at
+    instantiation and reused at each call.
+    """
+
+    def __init__(self, shape: tuple | list | np.ndarray) -> None:
+        self.shape = tuple(shape)
+        self._indices = np.indices(self.shape, dtype=np.float32)
+
+    def __call__(
+            self,
+            data: np.ndarray,
+            com: tuple | list | np.ndarray = None
+    ) -> np.ndarray:
+        if data.shape != self.shape:
+            raise ValueError(
+                f"data shape ({data.shape}) should match the shape the "
+                f"calculator was built for ({self.shape})."
+            )
+        if com is None:
+            com = center_of_mass(data)
+
+        distance_matrix = np.zeros(shape=self.shape)
+        for indices, c in zip(self._indices, com):
+            distance_matrix += (indices - c) ** 2
+        np.sqrt(distance_matrix, out=distance_matrix)
+        distance_matrix[data == 0] = 0
+        return distance_matrix
+
+
 def zero_to_nan(
         data: np.ndarray,
         boolean_values: bool = False
 ) -> np.ndarray:
-    """Convert zero values to np.nan."""
-    return np.where(data == 0, np.nan, 1 if boolean_values else data)
+    """
+    Convert zero values to np.nan. Floating and complex data keep their
+    dtype, other data are converted to float64. If boolean_values, the
+    other values are set to 1 and the returned array is of float32
+    type.
+    """
+    if boolean_values:
+        converted = np.ones(data.shape, dtype=np.float32)
+    else:
+        converted = data.astype(
+            data.dtype if np.issubdtype(data.dtype, np.inexact)
+            else np.float64,
+            copy=True
+        )
+    converted[data == 0] = np.nan
+    return converted
 
 
 def nan_to_zero(
         data: np.ndarray,
         boolean_values: bool = False
 ) -> np.ndarray:
-    """Convert np.nan values to 0."""
-    return np.where(np.isnan(data), 0, 1 if boolean_values else data)
+    """
+    Convert np.nan values to 0. If boolean_values, the other values are
+    set to 1 and the returned array is of uint8 type.
+    """
+    if boolean_values:
+        return (~np.isnan(data)).astype(np.uint8)
+    converted = data.copy()
+    converted[np.isnan(data)] = 0
+    return converted
 
 
 def to_bool(data: np.ndarray, nan_value: bool = False) -> np.ndarray:
-    """Convert values to 1 (True) if not nan otherwise to 0 (False)"""
-    return np.where(np.isnan(data), np.nan if nan_value else 0, 1)
+    """
+    Convert values to 1 (True) if not nan otherwise to 0 (False), or to
+    np.nan if nan_value. The returned array is of uint8 type, or float32
+    if nan_value.
+    """
+    if nan_value:
+        converted = np.ones(data.shape, dtype=np.float32)
+        converted[np.isnan(data)] = np.nan
+        return converted
+    return (~np.isnan(data)).astype(np.uint8)
 
 
 def nan_center_of_mass(
@@ -348,14 +510,15 @@ def nan_center_of_mass(
     Compute the center of mass of a np.ndarray that may contain
     nan values.
     """
-    if not np.isnan(data).any():
+    non_nan_mask = ~np.isnan(data)
+    if non_nan_mask.all():
         com = center_of_mass(data)
-
-    non_nan_coord = np.where(np.invert(np.isnan(data)))
-    com = np.average(
-        [non_nan_coord], axis=2,
-        weights=data[non_nan_coord]
-    )[0]
+    else:
+        non_nan_coord = np.nonzero(non_nan_mask)
+        weights = data[non_nan_coord]
+        com = np.array(
+            [np.sum(c * weights) for c in non_nan_coord]
+        ) / np.sum(weights)
     if return_int:
         return tuple([int(round(e)) for e in com])
     return tuple(com)
@@ -467,8 +630,8 @@ class CroppingHandler:
             The masked data array with the specified ROI.
         """
 
-        mask = np.ones_like(data)
-        mask[cls.roi_list_to_slices(roi)] = 0
+        mask = np.ones(data.shape, dtype=bool)
+        mask[cls.roi_list_to_slices(roi)] = False
         return np.ma.array(data, mask=mask)
 
     @staticmethod
@@ -512,25 +675,24 @@ class CroppingHandler:
             each dimension.
         """
 
-        # define how much to crop data
-        # plus_one is whether or not to add one to the bounds.
-        plus_one = np.where((np.array(output_shape) % 2 == 0), 0, 1)
-        crop = [[e//2, e//2 + plus_one[i]] for i, e in enumerate(output_shape)]
-        roi = []
+        # define how much to crop data, on the lower and upper sides.
+        # If the output_shape is odd, add one to the upper bound.
+        output_shape = np.array(output_shape)
+        where = np.array(where)
+        crop_lo = output_shape // 2
+        crop_hi = crop_lo + output_shape % 2
 
-        if input_shape is None:
-            for i in range(len(output_shape)):
-                roi.append(where[i]-crop[i][0])
-                roi.append(where[i]+crop[i][1])
-            return roi
+        start = where - crop_lo
+        end = where + crop_hi
 
-        for i, s in enumerate(input_shape):
+        if input_shape is not None:
+            input_shape = np.array(input_shape)
             # extend the roi to comply with the output_shape
-            add_left = where[i]+crop[i][1]-s if where[i]+crop[i][1] > s else 0
-            add_right = crop[i][0]-where[i] if where[i]-crop[i][0] < 0 else 0
+            add_left = np.maximum(end - input_shape, 0)
+            add_right = np.maximum(-start, 0)
 
-            roi.append(np.max([where[i]-crop[i][0], 0]) - add_left)
-            roi.append(np.min([where[i]+crop[i][1], s]) + add_right)
+            start = np.maximum(start, 0) - add_left
+            end = np.minimum(end, input_shape) + add_right
         # for i in range(0, len(roi), 2):
         #     if roi[i] < 0:
         #         warnings.warn(
@@ -539,7 +701,7 @@ class CroppingHandler:
         #         )
         #         roi[i+1] -= roi[i]
         #         roi[i] = 0
-        return roi
+        return np.stack((start, end), axis=1).ravel().tolist()
 
     @classmethod
     def chain_centering(
@@ -577,7 +739,7 @@ class CroppingHandler:
         position = None
         if verbose:
             print("Chain centering:")
-        for method in methods:
+        for i, method in enumerate(methods):
             # position is found in the masked data
             position = cls.get_position(masked_data, method)
             if verbose:
@@ -586,8 +748,10 @@ class CroppingHandler:
             # get the roi
             roi = cls.get_roi(output_shape, position, data.shape)
 
-            # mask the data values which are outside roi
-            masked_data = cls.get_masked_data(data, roi=roi)
+            # mask the data values which are outside roi, only required
+            # if another method must look for a position
+            if i < len(methods) - 1:
+                masked_data = cls.get_masked_data(data, roi=roi)
         # if (
         #         methods[-1] == "com"
         #         and (position != cls.get_position(masked_data, "com"))
@@ -602,7 +766,8 @@ class CroppingHandler:
             (start + stop) // 2
             for start, stop in zip(roi[::2], roi[1::2])
         )
-        cropped_data = masked_data.data[cls.roi_list_to_slices(roi)]
+        # the roi is a box, cropping does not require the mask
+        cropped_data = data[cls.roi_list_to_slices(roi)]
         cropped_position = tuple(p - r for p, r in zip(position, roi[::2]))
         return cropped_data.copy(), position, cropped_position, roi
 
@@ -643,17 +808,12 @@ class CroppingHandler:
                     "Required shape for cropping at the center is"
                     f"{safe_shape}"
                 )
-        plus_one = np.where((safe_shape % 2 == 0), 0, 1)
-        crop = [
-            [safe_shape[i]//2, safe_shape[i]//2 + plus_one[i]]
-            for i in range(len(safe_shape))
-        ]
-        roi = []
-        for i, s in enumerate(shape):
-            roi.append(np.max([where[i]-crop[i][0], 0]))
-            roi.append(np.min([where[i]+crop[i][1], s]))
+        crop_lo = safe_shape // 2
+        crop_hi = crop_lo + safe_shape % 2
+        start = np.maximum(np.array(position) - crop_lo, 0)
+        end = np.minimum(np.array(position) + crop_hi, shape)
 
-        return data[cls.roi_list_to_slices(roi)]
+        return data[tuple(slice(lo, hi) for lo, hi in zip(start, end))]
 
 
 def compute_corrected_angles(
@@ -682,16 +842,17 @@ def compute_corrected_angles(
 
     :return: the two corrected angles.
     """
-    inplane_correction = np.rad2deg(
-        np.arctan(
+    # scalar math, no need for numpy ufuncs
+    inplane_correction = math.degrees(
+        math.atan(
             (detector_coordinates[1] - direct_beam_position[0])
             * pixel_size
             / detector_distance
         )
     )
 
-    outofplane_correction = np.rad2deg(
-        np.arctan(
+    outofplane_correction = math.degrees(
+        math.atan(
             (detector_coordinates[0] - direct_beam_position[1])
             * pixel_size
             / detector_distance
@@ -734,6 +895,28 @@ def find_suitable_array_shape(
     return shape
 
 
+def _fft_kde(data: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Gaussian kernel density estimate of data evaluated on the evenly
+    spaced grid x. Data are binned on the grid and the histogram is
+    convolved with the Gaussian kernel using FFT, so the cost does not
+    scale with the number of samples times the number of grid points
+    as for scipy.stats.gaussian_kde. The bandwidth follows Scott's
+    rule, as gaussian_kde does by default.
+    """
+    spacing = x[1] - x[0]
+    edges = np.append(x - spacing / 2, x[-1] + spacing / 2)
+    counts, _ = np.histogram(data, bins=edges)
+
+    bandwidth = np.std(data, ddof=1) * data.size ** (-1 / 5)
+    half_width = int(np.ceil(4 * bandwidth / spacing))
+    offsets = np.arange(-half_width, half_width + 1) * spacing
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    kernel /= bandwidth * np.sqrt(2 * np.pi)
+
+    return fftconvolve(counts, kernel, mode="same") / data.size
+
+
 def find_isosurface(
         amplitude: np.ndarray,
         nbins: int = 100,
@@ -773,9 +956,8 @@ def find_isosurface(
     bin_size = bin_centres[1] - bin_centres[0]
 
     # fit the amplitude distribution
-    kernel = gaussian_kde(filtered_amplitude)
     x = np.linspace(0, 1, 1000)
-    fitted_counts = kernel(x)
+    fitted_counts = _fft_kde(filtered_amplitude, x)
 
     max_index = np.argmax(fitted_counts)
     right_gaussian_part = np.where(x >= x[max_index], fitted_counts, 0)
@@ -791,6 +973,9 @@ def find_isosurface(
     isosurface = x[max_index] - sigma_criterion * sigma_estimate
 
     if plot or show:
+        # seaborn is slow to import and only needed for plotting
+        import seaborn as sns
+
         figsize = get_figure_size()
         fig, ax = matplotlib.pyplot.subplots(1, 1, figsize=figsize)
         ax.bar(